@@ -99,7 +99,7 @@ class DebugAgentBackend:
                 tool_message = f"❌ **Tool failed:** `{tool_name}`\n\n**Error:** {result.error}"
             
             # Convert ToolResult to dict for socketio serialization
-            tool_call_info["result"] = result.dict() if hasattr(result, "dict") else result
+            tool_call_info["result"] = result._asdict() if hasattr(result, "_asdict") else result
             
         elif tool_call_type == "tool_call_error":
             # Update the tool call message with error
@@ -17,6 +17,10 @@ class DebuggerState(Enum):
     TERMINATED = "terminated"
 
 
+# States in which the target can be inspected (stack, frames, variables)
+INSPECTABLE_STATES = frozenset({DebuggerState.PAUSED, DebuggerState.CRASHED})
+
+
 class DebuggerEventType(Enum):
     """Types of debugger events."""
     INPUT = "input"  # Command sent to debugger
@@ -82,6 +86,7 @@ class BaseDebugger(ABC):
         self._event_callbacks: Dict[DebuggerEventType, Set[Callable[[DebuggerEvent], None]]] = {
             event_type: set() for event_type in DebuggerEventType
         }
+        self._any_event_callbacks: Set[Callable[[DebuggerEvent], None]] = set()
         self._event_lock = threading.Lock()
         self.console_log: List[Tuple[str, str, str]] = []  # (timestamp, type, content)
         self._console_lock = threading.Lock()
@@ -216,6 +221,24 @@ class BaseDebugger(ABC):
             if callback in self._event_callbacks[event_type]:
                 self._event_callbacks[event_type].remove(callback)
     
+    def register_any_event_callback(self, callback: Callable[[DebuggerEvent], None]):
+        """Register a callback for every event type.
+        
+        Args:
+            callback: Function to call when any event occurs. Should accept a DebuggerEvent parameter.
+        """
+        with self._event_lock:
+            self._any_event_callbacks.add(callback)
+    
+    def unregister_any_event_callback(self, callback: Callable[[DebuggerEvent], None]):
+        """Unregister a callback registered with register_any_event_callback.
+        
+        Args:
+            callback: The callback function to remove
+        """
+        with self._event_lock:
+            self._any_event_callbacks.discard(callback)
+    
     def _fire_event(self, event_type: DebuggerEventType, content: str, data: Optional[Dict[str, Any]] = None):
         """Fire an event to all registered callbacks.
         
@@ -232,7 +255,7 @@ class BaseDebugger(ABC):
         )
         
         with self._event_lock:
-            callbacks = self._event_callbacks[event_type].copy()
+            callbacks = self._event_callbacks[event_type] | self._any_event_callbacks
         
         for callback in callbacks:
             try:
@@ -18,14 +18,14 @@ try:
         DebuggerEventType, DebuggerEvent
     )
     from src.utils.exceptions import DebuggerError, AttachError, LaunchError
-    from src.utils.process_utils import ProcessManager
+    from src.utils.process_utils import is_process_running
 except ImportError:
     from debugger.base import (
         BaseDebugger, DebuggerState, StackFrame, CrashInfo, BreakpointInfo,
         DebuggerEventType, DebuggerEvent
     )
     from utils.exceptions import DebuggerError, AttachError, LaunchError
-    from utils.process_utils import ProcessManager
+    from utils.process_utils import is_process_running
 
 
 class WindowsDebugger(BaseDebugger):
@@ -280,7 +280,7 @@ class WindowsDebugger(BaseDebugger):
         """Attach debugger to a running process using cdb.exe."""
         try:
             # Check if process exists
-            if not ProcessManager.is_process_running(pid):
+            if not is_process_running(pid):
                 raise AttachError(f"Process {pid} is not running")
             
             self._fire_event(DebuggerEventType.SYSTEM, f"Attaching to process {pid}...")
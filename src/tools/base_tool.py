@@ -1,16 +1,15 @@
 """Base tool interface for OpenAI-compatible debugging tools."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from typing import Dict, Any, Optional, NamedTuple
 
 
-class ToolResult(BaseModel):
+class ToolResult(NamedTuple):
     """Result of a tool execution."""
     success: bool
     data: Any
     error: Optional[str] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Optional[Dict[str, Any]] = None
 
 
 class BaseTool(ABC):
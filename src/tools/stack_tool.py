@@ -1,16 +1,39 @@
 """Tool for analyzing stack traces and crashes."""
 
+import datetime
+import operator
 from typing import Dict, Any, Optional
 
 # Handle imports for both package and direct execution
 try:
     from src.tools.base_tool import BaseTool, ToolResult
-    from src.debugger.base import DebuggerState
+    from src.debugger.base import DebuggerState, INSPECTABLE_STATES
+    from src.utils.exceptions import DebuggerError
+    from src.utils.config import config
 except ImportError:
     from tools.base_tool import BaseTool, ToolResult
-    from debugger.base import DebuggerState
+    from debugger.base import DebuggerState, INSPECTABLE_STATES
+    from utils.exceptions import DebuggerError
+    from utils.config import config
 
 
+# Shared schema for tools that take no arguments. Kept as a plain dict so the
+# OpenAI client can serialize it; treat it as read-only.
+_NO_PARAMETERS: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+# Keys of a formatted stack frame, paired with the StackFrame attributes they come from
+_FRAME_KEYS = ("function", "file", "line", "module", "address")
+_frame_get = operator.attrgetter("function_name", "file_path", "line_number", "module_name", "address")
+
+
+def _format_frame(frame) -> Dict[str, Any]:
+    """Format a StackFrame as a JSON-friendly dict for the AI."""
+    return dict(zip(_FRAME_KEYS, _frame_get(frame)))
+
 class AnalyzeCrashTool(BaseTool):
     """Tool to analyze crash information when a process crashes."""
     
@@ -22,57 +45,52 @@ class AnalyzeCrashTool(BaseTool):
     def description(self) -> str:
         return "Analyze crash information when the debugged process crashes, providing stack trace and crash details"
     
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    parameters = _NO_PARAMETERS
     
     def execute(self, **kwargs) -> ToolResult:
         """Execute crash analysis."""
         try:
             # Check if process has crashed
-            if self.debugger.get_state() != DebuggerState.CRASHED:
+            state = self.debugger.get_state()
+            if state != DebuggerState.CRASHED:
                 return ToolResult(
                     success=False,
                     data=None,
                     error="Process has not crashed - no crash information available",
-                    metadata={"action": "analyze_crash", "state": self.debugger.get_state().value}
+                    metadata={"action": "analyze_crash", "state": state.value}
                 )
             
             # Get crash information
             crash_info = self.debugger.analyze_crash()
             
             if crash_info:
+                # Only the frames nearest the crash are useful to the AI, so clip
+                # very deep stacks (e.g. stack overflows) before formatting them
+                max_depth = config.max_crash_analysis_depth
+                truncated = len(crash_info.stack_trace) > max_depth
+                
                 # Format crash information for AI analysis
                 formatted_crash = {
                     "exception_type": crash_info.exception_type,
                     "exception_message": crash_info.exception_message,
                     "crash_address": crash_info.crash_address,
-                    "stack_trace": [
-                        {
-                            "function": frame.function_name,
-                            "file": frame.file_path,
-                            "line": frame.line_number,
-                            "module": frame.module_name,
-                            "address": frame.address
-                        }
-                        for frame in crash_info.stack_trace
-                    ],
+                    "stack_trace": list(map(_format_frame, crash_info.stack_trace[:max_depth])),
                     "registers": crash_info.registers,
                     "modules": crash_info.modules
                 }
                 
+                metadata = {
+                    "action": "analyze_crash",
+                    "timestamp": self._get_timestamp(),
+                    "crash_type": crash_info.exception_type
+                }
+                if truncated:
+                    metadata["truncated"] = True
+                
                 return ToolResult(
                     success=True,
                     data=formatted_crash,
-                    metadata={
-                        "action": "analyze_crash",
-                        "timestamp": self._get_timestamp(),
-                        "crash_type": crash_info.exception_type
-                    }
+                    metadata=metadata
                 )
             else:
                 return ToolResult(
@@ -82,7 +100,7 @@ class AnalyzeCrashTool(BaseTool):
                     metadata={"action": "analyze_crash"}
                 )
                 
-        except Exception as e:
+        except (DebuggerError, AttributeError, ValueError) as e:
             return ToolResult(
                 success=False,
                 data=None,
@@ -92,7 +110,6 @@ class AnalyzeCrashTool(BaseTool):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        import datetime
         return datetime.datetime.now().isoformat()
 
 
@@ -107,20 +124,14 @@ class GetStackTraceTool(BaseTool):
     def description(self) -> str:
         return "Get the current stack trace of the debugged process when paused or crashed"
     
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    parameters = _NO_PARAMETERS
     
     def execute(self, **kwargs) -> ToolResult:
         """Execute stack trace retrieval."""
         try:
             # Check if debugger is in a state where we can get stack trace
             state = self.debugger.get_state()
-            if state not in [DebuggerState.PAUSED, DebuggerState.CRASHED]:
+            if state not in INSPECTABLE_STATES:
                 return ToolResult(
                     success=False,
                     data=None,
@@ -131,16 +142,7 @@ class GetStackTraceTool(BaseTool):
             # Get stack trace
             stack_frames = self.debugger.get_stack_trace()
             
-            formatted_stack = [
-                {
-                    "function": frame.function_name,
-                    "file": frame.file_path,
-                    "line": frame.line_number,
-                    "module": frame.module_name,
-                    "address": frame.address,
-                }
-                for frame in stack_frames
-            ]
+            formatted_stack = list(map(_format_frame, stack_frames))
             
             return ToolResult(
                 success=True,
@@ -155,7 +157,7 @@ class GetStackTraceTool(BaseTool):
                 }
             )
             
-        except Exception as e:
+        except (DebuggerError, AttributeError, ValueError) as e:
             return ToolResult(
                 success=False,
                 data=None,
@@ -165,7 +167,6 @@ class GetStackTraceTool(BaseTool):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        import datetime
         return datetime.datetime.now().isoformat()
 
 
@@ -180,20 +181,14 @@ class GetCurrentFrameTool(BaseTool):
     def description(self) -> str:
         return "Get the current frame (top of stack) of the debugged process when paused or crashed"
     
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    parameters = _NO_PARAMETERS
     
     def execute(self, **kwargs) -> ToolResult:
         """Execute current frame retrieval."""
         try:
             # Check if debugger is in a state where we can get current frame
             state = self.debugger.get_state()
-            if state not in [DebuggerState.PAUSED, DebuggerState.CRASHED]:
+            if state not in INSPECTABLE_STATES:
                 return ToolResult(
                     success=False,
                     data=None,
@@ -205,17 +200,9 @@ class GetCurrentFrameTool(BaseTool):
             current_frame = self.debugger.get_current_frame()
             
             if current_frame:
-                formatted_frame = {
-                    "function": current_frame.function_name,
-                    "file": current_frame.file_path,
-                    "line": current_frame.line_number,
-                    "module": current_frame.module_name,
-                    "address": current_frame.address,
-                }
-                
                 return ToolResult(
                     success=True,
-                    data=formatted_frame,
+                    data=_format_frame(current_frame),
                     metadata={
                         "action": "get_current_frame",
                         "timestamp": self._get_timestamp(),
@@ -230,7 +217,7 @@ class GetCurrentFrameTool(BaseTool):
                     metadata={"action": "get_current_frame"}
                 )
             
-        except Exception as e:
+        except (DebuggerError, AttributeError, ValueError) as e:
             return ToolResult(
                 success=False,
                 data=None,
@@ -240,7 +227,6 @@ class GetCurrentFrameTool(BaseTool):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        import datetime
         return datetime.datetime.now().isoformat()
 
 
@@ -301,7 +287,7 @@ class WaitForEventTool(BaseTool):
                     }
                 )
                 
-        except Exception as e:
+        except (DebuggerError, AttributeError, ValueError) as e:
             return ToolResult(
                 success=False,
                 data=None,
@@ -311,5 +297,4 @@ class WaitForEventTool(BaseTool):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        import datetime
         return datetime.datetime.now().isoformat() 
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Tools for stepping through code execution."""
 
+import datetime
 from typing import Dict, Any, Optional
 
 # Handle imports for both package and direct execution
@@ -13,6 +14,13 @@ except ImportError:
     from utils.exceptions import DebuggerError
 
 
+# Debugger state required before each stepping action can run
+_ACTION_STATE_REQUIREMENTS = {
+    "step_over": DebuggerState.PAUSED,
+    "step_into": DebuggerState.PAUSED,
+    "step_out": DebuggerState.PAUSED,
+}
+
 class StepTool(BaseTool):
     """Tool to step through code execution with different stepping modes."""
     
@@ -44,25 +52,18 @@ class StepTool(BaseTool):
             self.validate_parameters(**kwargs)
             action = kwargs["action"]
 
+            state = self.debugger.get_state()
+
             # Check if debugger is attached for all actions
             if not self.debugger.is_attached():
                 return ToolResult(
                     success=False,
                     data=None,
                     error="Cannot perform action - debugger is not attached to a process",
-                    metadata={"action": action, "state": self.debugger.get_state().value}
+                    metadata={"action": action, "state": state.value}
                 )
 
-            state = self.debugger.get_state()
-
-            # Define required state for each action
-            action_state_requirements = {
-                "step_over": DebuggerState.PAUSED,
-                "step_into": DebuggerState.PAUSED,
-                "step_out": DebuggerState.PAUSED,
-            }
-
-            required_state = action_state_requirements.get(action)
+            required_state = _ACTION_STATE_REQUIREMENTS.get(action)
             if required_state and state != required_state:
                 return ToolResult(
                     success=False,
@@ -72,19 +73,20 @@ class StepTool(BaseTool):
                 )
 
             # Execute the appropriate stepping action
-            if action == "step_over":
-                success = self.debugger.step_over()
-            elif action == "step_into":
-                success = self.debugger.step_into()
-            elif action == "step_out":
-                success = self.debugger.step_out()
-            else:
+            step_actions = {
+                "step_over": self.debugger.step_over,
+                "step_into": self.debugger.step_into,
+                "step_out": self.debugger.step_out,
+            }
+            step_fn = step_actions.get(action)
+            if step_fn is None:
                 return ToolResult(
                     success=False,
                     data=None,
                     error=f"Unknown stepping action: {action}",
                     metadata={"action": action}
                 )
+            success = step_fn()
 
             if success:
                 return ToolResult(
@@ -113,7 +115,7 @@ class StepTool(BaseTool):
                 error=f"Failed to {kwargs.get('action', 'step')}: {str(e)}",
                 metadata={"action": kwargs.get('action', 'step')}
             )
-        except Exception as e:
+        except (AttributeError, ValueError) as e:
             return ToolResult(
                 success=False,
                 data=None,
@@ -123,5 +125,4 @@ class StepTool(BaseTool):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        import datetime
         return datetime.datetime.now().isoformat() 
\ No newline at end of file
@@ -1,14 +1,17 @@
 """Tool for inspecting variables in the debugged process."""
 
+import datetime
 from typing import Dict, Any, Optional
 
 # Handle imports for both package and direct execution
 try:
     from src.tools.base_tool import BaseTool, ToolResult
-    from src.debugger.base import DebuggerState
+    from src.debugger.base import INSPECTABLE_STATES
+    from src.utils.exceptions import DebuggerError
 except ImportError:
     from tools.base_tool import BaseTool, ToolResult
-    from debugger.base import DebuggerState
+    from debugger.base import INSPECTABLE_STATES
+    from utils.exceptions import DebuggerError
 
 
 class GetVariablesTool(BaseTool):
@@ -45,7 +48,7 @@ class GetVariablesTool(BaseTool):
         try:
             # Check if debugger is in a state where we can get variables
             state = self.debugger.get_state()
-            if state not in [DebuggerState.PAUSED, DebuggerState.CRASHED]:
+            if state not in INSPECTABLE_STATES:
                 return ToolResult(
                     success=False,
                     data=None,
@@ -81,7 +84,7 @@ class GetVariablesTool(BaseTool):
                 }
             )
             
-        except Exception as e:
+        except (DebuggerError, AttributeError, ValueError) as e:
             return ToolResult(
                 success=False,
                 data=None,
@@ -91,5 +94,4 @@ class GetVariablesTool(BaseTool):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp as string."""
-        import datetime
         return datetime.datetime.now().isoformat() 
\ No newline at end of file
@@ -1,11 +1,13 @@
 """Gradio web interface for the debug agent."""
 
-import gradio as gr
 import sys
 import time
 import threading
+import io
 import json
-from typing import List, Tuple, Optional
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 from collections import deque
 from datetime import datetime
 
@@ -25,10 +27,156 @@ except ImportError:
     from utils.config import config
     from utils.exceptions import DebugAgentError
 
+# Gradio pulls in a large web stack, so it is only imported when the UI is built
+if TYPE_CHECKING:
+    import gradio as gr
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of console events rendered into the HTML console view
+_CONSOLE_RENDER_LIMIT = 500
+
+# Minimum time in seconds between two rebuilds of the HTML console
+_CONSOLE_RENDER_INTERVAL = 0.05
+
+# Tool call payloads are pretty-printed in the chat only below this many
+# characters of compact JSON, and cut off above the maximum
+_TOOL_JSON_INDENT_LIMIT = 1024
+_TOOL_JSON_MAX_CHARS = 8192
+
+# Static HTML around the console view; only the event spans or error text vary
+_CONSOLE_PREFIX = '<div class="debugger-console">'
+_CONSOLE_SUFFIX = '</div>'
+_CONSOLE_EMPTY_HTML = '<div style="color: #888; font-family: monospace;">No debugger events captured yet. Start debugging to see output.</div>'
+_CONSOLE_ERROR_PREFIX = '<div style="color: #ff0000; font-family: monospace;">Error getting console output: '
+
+# Console tag and CSS class for each debugger event type
+_EVENT_TAGS_HTML = {
+    DebuggerEventType.INPUT: ("[IN]", "event-input"),
+    DebuggerEventType.OUTPUT: ("[OUT]", "event-output"),
+    DebuggerEventType.ERROR: ("[ERR]", "event-error"),
+    DebuggerEventType.SYSTEM: ("[SYS]", "event-system"),
+    DebuggerEventType.STATE_CHANGE: ("[STATE]", "event-state"),
+    DebuggerEventType.BREAKPOINT_HIT: ("[BP]", "event-breakpoint"),
+    DebuggerEventType.EXCEPTION: ("[EXC]", "event-exception"),
+    DebuggerEventType.PROCESS_TERMINATED: ("[TERM]", "event-terminated")
+}
+_UNKNOWN_EVENT_TAG_HTML = ("[UNK]", "event-output")
+
+# Plain-text console tag for each debugger event type
+_EVENT_TAGS_PLAIN = {event_type: tag for event_type, (tag, _) in _EVENT_TAGS_HTML.items()}
+
+
+class EventRing:
+    """Fixed-capacity ring buffer of debugger events.
+    
+    Once full, each append overwrites the oldest event. Every append also
+    advances an absolute counter, so callers can fetch just the events added
+    since a previous position with slice_from().
+    """
+    
+    __slots__ = ("_buf", "_head", "_size", "_cap", "_total")
+    
+    def __init__(self, capacity: int):
+        self._buf: List[Optional[DebuggerEvent]] = [None] * capacity
+        self._head = 0  # Index of the next slot to write
+        self._size = 0
+        self._cap = capacity
+        self._total = 0
+    
+    @property
+    def total_appended(self) -> int:
+        """Number of events ever appended, including evicted and cleared ones."""
+        return self._total
+    
+    def append(self, event: DebuggerEvent):
+        """Append an event, evicting the oldest one if the buffer is full."""
+        self._buf[self._head] = event
+        self._head = (self._head + 1) % self._cap
+        if self._size < self._cap:
+            self._size += 1
+        self._total += 1
+    
+    def extend(self, events: List[DebuggerEvent]):
+        """Append several events in order."""
+        for event in events:
+            self.append(event)
+    
+    def clear(self):
+        """Remove all buffered events. total_appended is left unchanged."""
+        self._buf = [None] * self._cap
+        self._head = 0
+        self._size = 0
+    
+    def slice_from(self, index: int) -> List[DebuggerEvent]:
+        """Get the buffered events whose absolute position is index or later."""
+        count = min(self._total - index, self._size)
+        if count <= 0:
+            return []
+        start = (self._head - count) % self._cap
+        end = start + count
+        if end <= self._cap:
+            return self._buf[start:end]
+        return self._buf[start:] + self._buf[:end - self._cap]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        return iter(self.slice_from(self._total - self._size))
+
+
+def _format_json_for_display(data) -> str:
+    """Serialize a tool payload for the chat, pretty-printing only small ones."""
+    text = json.dumps(data, separators=(",", ":"))
+    if len(text) < _TOOL_JSON_INDENT_LIMIT:
+        return json.dumps(data, indent=2)
+    if len(text) > _TOOL_JSON_MAX_CHARS:
+        return text[:_TOOL_JSON_MAX_CHARS] + " ... (truncated)"
+    return text
+
+
+def _use_example_prompt(prompt: str) -> Tuple[List[dict], str, str]:
+    """Reset the chat and place an example prompt in the message box."""
+    return [], prompt, ""
+
 
 class DebugAgentInterface:
     """Gradio interface for the debug agent."""
     
+    __slots__ = (
+        "debugger",
+        "tool_registry",
+        "completion_handler",
+        "chat_history",
+        "_pending_tool_calls",
+        "_tool_call_html_cache",
+        "_tool_call_html_dirty",
+        "console_events",
+        "_pending_events",
+        "_pending_lock",
+        "_events_available",
+        "_console_lock",
+        "_console_html_fragments",
+        "_console_html_cache",
+        "_console_rendered_total",
+        "_last_render_ts",
+    )
+    
+    # Example prompt button labels and the prompts they place in the message box
+    _EXAMPLE_LABELS = (
+        "Debug a C++ application",
+        "Analyze a crash dump",
+        "Help with access violation",
+        "Set breakpoints",
+    )
+    _EXAMPLE_PROMPTS = (
+        "Help me debug my C++ application. The executable is at C:\\path\\to\\app.exe",
+        "I have a crash dump file. Can you help me analyze it?",
+        "My application is crashing with an access violation. What should I do?",
+        "How do I set breakpoints to debug my application?",
+    )
+    
     def __init__(self):
         # Initialize debugger using factory
         self.debugger = DebuggerFactory.create_debugger()
@@ -43,113 +191,123 @@ class DebugAgentInterface:
         # Chat history for UI
         self.chat_history: List[dict] = []
         
-        # Console event storage - use deque for efficient append/pop operations
-        self.console_events: deque = deque(maxlen=1000)  # Keep last 1000 events
-        self._last_event_count = 0  # Track for efficient auto-refresh
+        # Index into chat_history of each started tool call, keyed by tool call id
+        self._pending_tool_calls: Dict[str, int] = {}
+        
+        # Rendered tool call HTML, rebuilt only after _handle_tool_call changes history
+        self._tool_call_html_cache = ""
+        self._tool_call_html_dirty = False
+        
+        # Console event storage - ring buffer keeping the last 1000 events
+        self.console_events = EventRing(1000)
+        
+        # Debugger callbacks only queue events here; the UI side moves them into
+        # console_events, so the buffer is never mutated while it is being read
+        self._pending_events: List[DebuggerEvent] = []
+        self._pending_lock = threading.Lock()
+        self._events_available = threading.Event()  # Set while events are queued
+        
+        # Gradio runs each listener on its own worker thread, so draining,
+        # reading console_events and rendering are serialized on this lock.
+        # It is always taken before _pending_lock
+        self._console_lock = threading.Lock()
         
-        # Auto-refresh control
-        self._auto_refresh_enabled = False
-        self._auto_refresh_thread = None
-        self._stop_auto_refresh = threading.Event()
+        # Rendered console HTML is cached and rebuilt at most once per
+        # _CONSOLE_RENDER_INTERVAL; _console_rendered_total is the number of
+        # events ever appended to console_events at the last render
+        self._console_html_fragments: deque = deque(maxlen=_CONSOLE_RENDER_LIMIT)
+        self._console_html_cache: Optional[str] = None
+        self._console_rendered_total = 0
+        self._last_render_ts = 0.0
         
         # Register event callbacks to capture debugger events
         self._register_debugger_events()
     
     def _register_debugger_events(self):
-        """Register callbacks for all debugger event types."""
-        for event_type in DebuggerEventType:
-            self.debugger.register_event_callback(event_type, self._handle_debugger_event)
+        """Register a callback for all debugger event types."""
+        self.debugger.register_any_event_callback(self._handle_debugger_event)
     
     def _handle_debugger_event(self, event: DebuggerEvent):
         """Handle debugger events and store them for console display."""
-        # Store the event for console display
-        self.console_events.append(event)
+        # Queue the event for console display
+        with self._pending_lock:
+            self._pending_events.append(event)
+            self._events_available.set()
     
-    def _format_event_for_console(self, event: DebuggerEvent) -> str:
-        """Format a debugger event for console display with special tags."""
-        # Define color tags and CSS classes for different event types
-        event_tags = {
-            DebuggerEventType.INPUT: ("[IN]", "event-input"),
-            DebuggerEventType.OUTPUT: ("[OUT]", "event-output"), 
-            DebuggerEventType.ERROR: ("[ERR]", "event-error"),
-            DebuggerEventType.SYSTEM: ("[SYS]", "event-system"),
-            DebuggerEventType.STATE_CHANGE: ("[STATE]", "event-state"),
-            DebuggerEventType.BREAKPOINT_HIT: ("[BP]", "event-breakpoint"),
-            DebuggerEventType.EXCEPTION: ("[EXC]", "event-exception"),
-            DebuggerEventType.PROCESS_TERMINATED: ("[TERM]", "event-terminated")
-        }
-        
-        tag, css_class = event_tags.get(event.type, ("[UNK]", "event-output"))
-        timestamp = event.timestamp
-        content = event.content
-        
-        # Format with HTML span for color coding
-        return f'<span class="{css_class}">{timestamp} {tag} {content}</span>'
+    def _drain_pending_events(self):
+        """Move events queued by debugger callbacks into the console buffer."""
+        # Extend under the same lock as the swap so batches land in arrival order
+        with self._pending_lock:
+            batch, self._pending_events = self._pending_events, []
+            self._events_available.clear()
+            if batch:
+                self.console_events.extend(batch)
     
     def chat_with_ai(self, message: str, history: List[dict]) -> Tuple[List[dict], str, str]:
         """Handle chat interaction with the AI debugger."""
+        if not message or not message.strip():
+            return history, "", ""
+        
         try:
-            if not message.strip():
-                return history, "", ""
-            
             # Get AI response
             ai_response = self.completion_handler.process_message(message)
-            
-            # Update history with OpenAI-style messages
-            history.append({"role": "user", "content": message})
-            history.append({"role": "assistant", "content": ai_response})
-            
-            # Format tool call messages for display
-            tool_call_html = self._format_tool_calls_for_display()
-            
-            return history, "", tool_call_html
-            
         except Exception as e:
             error_msg = f"Error: {str(e)}"
             history.append({"role": "user", "content": message})
             history.append({"role": "assistant", "content": error_msg})
             return history, "", ""
+        
+        # Update history with OpenAI-style messages
+        history.append({"role": "user", "content": message})
+        history.append({"role": "assistant", "content": ai_response})
+        
+        # Format tool call messages for display
+        tool_call_html = self._format_tool_calls_for_display()
+        
+        return history, "", tool_call_html
     
     def _format_tool_calls_for_display(self) -> str:
         """Format tool call messages for HTML display."""
-        tool_call_messages = [msg for msg in self.chat_history if msg.get("role") == "tool_call"]
-        
-        if not tool_call_messages:
-            return ""
+        # Reuse the last render unless a tool call was added or updated since
+        if not self._tool_call_html_dirty:
+            return self._tool_call_html_cache
         
-        html_parts = []
-        for msg in tool_call_messages:
+        buf = io.StringIO()
+        write = buf.write
+        separator = ""
+        for msg in self.chat_history:
+            if msg.get("role") != "tool_call":
+                continue
+            
             status = msg.get("status", "started")
             content = msg.get("content", "")
             
-            # Determine CSS class based on status
-            css_class = f"tool-call-{status}"
-            
-            # Format the message with proper styling
-            html_part = f'''
-            <div class="tool-call-message {css_class}">
+            # Format the message with a CSS class based on status
+            write(separator)
+            write(f'''
+            <div class="tool-call-message tool-call-{status}">
                 {content}
             </div>
-            '''
-            html_parts.append(html_part)
+            ''')
+            separator = "\n"
         
-        return "\n".join(html_parts)
+        self._tool_call_html_cache = buf.getvalue()
+        self._tool_call_html_dirty = False
+        return self._tool_call_html_cache
     
     def get_debugger_status(self) -> str:
         """Get current debugger status."""
         try:
             state = self.debugger.get_state()
-            status_info = [
-                f"**Debugger State:** {state.value.title()}",
-                f"**Target PID:** {self.debugger.target_pid or 'None'}",
-                f"**Attached:** {'Yes' if self.debugger.is_attached() else 'No'}"
-            ]
-            
-            if self.debugger.list_breakpoints():
-                bp_count = len(self.debugger.list_breakpoints())
-                status_info.append(f"**Breakpoints:** {bp_count}")
-            
-            return "\n".join(status_info)
+            attached = self.debugger.is_attached()
+            breakpoints = self.debugger.list_breakpoints()
+            
+            return (
+                f"**Debugger State:** {state.value.title()}\n"
+                f"**Target PID:** {self.debugger.target_pid or 'None'}\n"
+                f"**Attached:** {'Yes' if attached else 'No'}"
+                + (f"\n**Breakpoints:** {len(breakpoints)}" if breakpoints else "")
+            )
             
         except Exception as e:
             return f"Error getting status: {str(e)}"
@@ -157,107 +315,83 @@ class DebugAgentInterface:
     def get_debugger_console(self) -> str:
         """Get the current debugger console output from captured events."""
         try:
-            if not self.console_events:
-                return '<div style="color: #888; font-family: monospace;">No debugger events captured yet. Start debugging to see output.</div>'
-            
-            # Format all events for display
-            formatted_events = []
-            for event in self.console_events:
-                formatted_events.append(self._format_event_for_console(event))
-            
-            # Join with line breaks and wrap in a styled container
-            html_content = '<br>'.join(formatted_events)
-            return f'''
-            <div style="
-                background-color: #1a1a1a; 
-                color: #00ff00; 
-                font-family: 'Courier New', monospace; 
-                font-size: 12px; 
-                border: 1px solid #333; 
-                border-radius: 5px; 
-                padding: 10px; 
-                max-height: 400px; 
-                overflow-y: auto; 
-                white-space: pre-wrap;
-                line-height: 1.4;
-            ">
-                {html_content}
-            </div>
-            '''
+            with self._console_lock:
+                self._drain_pending_events()
+                if not self.console_events:
+                    return _CONSOLE_EMPTY_HTML
+                
+                # Serve the cached render if nothing new arrived, and rebuild at most
+                # once per interval while events are streaming in
+                now = time.monotonic()
+                event_total = self.console_events.total_appended
+                if self._console_html_cache is not None and (
+                    event_total == self._console_rendered_total
+                    or now - self._last_render_ts < _CONSOLE_RENDER_INTERVAL
+                ):
+                    return self._console_html_cache
+                
+                # Format only the events that arrived since the last render. Spans
+                # for older events are reused from the fragment deque, which is capped
+                # at _CONSOLE_RENDER_LIMIT since the whole console is re-sent to the
+                # browser on every refresh
+                new_events = self.console_events.slice_from(
+                    max(self._console_rendered_total, event_total - _CONSOLE_RENDER_LIMIT)
+                )
+                append = self._console_html_fragments.append
+                tags_get = _EVENT_TAGS_HTML.get
+                for event in new_events:
+                    tag, css_class = tags_get(event.type, _UNKNOWN_EVENT_TAG_HTML)
+                    append(f'<span class="{css_class}">{event.timestamp} {tag} {event.content}</span>')
+                
+                # Join with line breaks and wrap in a styled container
+                html_content = '<br>'.join(self._console_html_fragments)
+                self._console_html_cache = _CONSOLE_PREFIX + html_content + _CONSOLE_SUFFIX
+                self._console_rendered_total = event_total
+                self._last_render_ts = now
+                return self._console_html_cache
             
         except Exception as e:
-            return f'<div style="color: #ff0000; font-family: monospace;">Error getting console output: {str(e)}</div>'
+            return _CONSOLE_ERROR_PREFIX + str(e) + _CONSOLE_SUFFIX
     
     def get_debugger_console_plain(self) -> str:
         """Get the current debugger console output as plain text."""
         try:
-            if not self.console_events:
-                return "No debugger events captured yet. Start debugging to see output."
+            with self._console_lock:
+                self._drain_pending_events()
+                if not self.console_events:
+                    return "No debugger events captured yet. Start debugging to see output."
+                events = list(self.console_events)
             
             # Format all events for display as plain text
-            formatted_events = []
-            for event in self.console_events:
-                # Define plain text tags for different event types
-                event_tags = {
-                    DebuggerEventType.INPUT: "[IN]",
-                    DebuggerEventType.OUTPUT: "[OUT]", 
-                    DebuggerEventType.ERROR: "[ERR]",
-                    DebuggerEventType.SYSTEM: "[SYS]",
-                    DebuggerEventType.STATE_CHANGE: "[STATE]",
-                    DebuggerEventType.BREAKPOINT_HIT: "[BP]",
-                    DebuggerEventType.EXCEPTION: "[EXC]",
-                    DebuggerEventType.PROCESS_TERMINATED: "[TERM]"
-                }
-                
-                tag = event_tags.get(event.type, "[UNK]")
-                timestamp = event.timestamp
-                content = event.content
-                
-                formatted_events.append(f"{timestamp} {tag} {content}")
-            
-            return "\n".join(formatted_events)
+            tags_get = _EVENT_TAGS_PLAIN.get
+            return "\n".join(
+                f"{event.timestamp} {tags_get(event.type, '[UNK]')} {event.content}"
+                for event in events
+            )
             
         except Exception as e:
             return f"Error getting console output: {str(e)}"
     
     def get_event_count(self) -> int:
         """Get the number of events currently stored."""
-        return len(self.console_events)
-    
-    def start_auto_refresh(self):
-        """Start auto-refresh functionality."""
-        if not self._auto_refresh_enabled:
-            self._auto_refresh_enabled = True
-            self._stop_auto_refresh.clear()
-            self._auto_refresh_thread = threading.Thread(target=self._auto_refresh_loop, daemon=True)
-            self._auto_refresh_thread.start()
-    
-    def stop_auto_refresh(self):
-        """Stop auto-refresh functionality."""
-        self._auto_refresh_enabled = False
-        self._stop_auto_refresh.set()
-        if self._auto_refresh_thread and self._auto_refresh_thread.is_alive():
-            self._auto_refresh_thread.join(timeout=1)
+        with self._console_lock:
+            self._drain_pending_events()
+            return len(self.console_events)
     
-    def _auto_refresh_loop(self):
-        """Background thread for auto-refresh functionality."""
-        while self._auto_refresh_enabled and not self._stop_auto_refresh.is_set():
-            try:
-                if self.debugger.is_attached():
-                    current_count = len(self.console_events)
-                    if current_count != self._last_event_count:
-                        self._last_event_count = current_count
-                        # The UI will be updated on the next manual refresh
-                time.sleep(2)  # Check every 2 seconds
-            except Exception as e:
-                print(f"Auto-refresh error: {e}")
-                time.sleep(2)
+    def _has_console_updates(self) -> bool:
+        """Check whether the console has events that are not rendered yet."""
+        return self._events_available.is_set() or self._console_rendered_total != self.console_events.total_appended
     
     def clear_debugger_console(self) -> Tuple[str, str]:
         """Clear the debugger console log."""
         try:
-            # Clear the console events
-            self.console_events.clear()
+            # Clear the console events, including any not yet drained
+            with self._console_lock:
+                self._drain_pending_events()
+                self.console_events.clear()
+                self._console_html_fragments.clear()
+                self._console_html_cache = None
+                self._console_rendered_total = self.console_events.total_appended
             return "Console cleared.", "Console cleared."
         except Exception as e:
             error_msg = f"Error clearing console: {str(e)}"
@@ -267,10 +401,15 @@ class DebugAgentInterface:
         """Clear the chat history."""
         self.completion_handler.clear_history()
         self.chat_history.clear()  # Clear tool call messages too
+        self._pending_tool_calls.clear()
+        self._tool_call_html_cache = ""
+        self._tool_call_html_dirty = False
         return [], "", ""
     
-    def create_interface(self) -> gr.Blocks:
+    def create_interface(self) -> "gr.Blocks":
         """Create the Gradio interface."""
+        import gradio as gr
+        
         with gr.Blocks(
             title="Debug Agent - AI-Powered Debugging Assistant",
             theme=gr.themes.Soft(),
@@ -288,6 +427,19 @@ class DebugAgentInterface:
             .console-box label {
                 color: #333 !important;
             }
+            .debugger-console {
+                background-color: #1a1a1a !important;
+                color: #00ff00 !important;
+                font-family: 'Courier New', monospace !important;
+                font-size: 12px !important;
+                border: 1px solid #333 !important;
+                border-radius: 5px !important;
+                padding: 10px !important;
+                max-height: 400px !important;
+                overflow-y: auto !important;
+                white-space: pre-wrap !important;
+                line-height: 1.4 !important;
+            }
             /* Event type color coding */
             .event-input { color: #ffff00 !important; }  /* Yellow for input */
             .event-output { color: #00ff00 !important; } /* Green for output */
@@ -407,12 +559,7 @@ class DebugAgentInterface:
             # Example prompts
             with gr.Row():
                 gr.Markdown("### Example Prompts")
-                example_buttons = [
-                    gr.Button("Debug a C++ application", size="sm"),
-                    gr.Button("Analyze a crash dump", size="sm"),
-                    gr.Button("Help with access violation", size="sm"),
-                    gr.Button("Set breakpoints", size="sm")
-                ]
+                example_buttons = [gr.Button(label, size="sm") for label in self._EXAMPLE_LABELS]
             
             # Event handlers
             send_btn.click(
@@ -437,34 +584,11 @@ class DebugAgentInterface:
                 outputs=status_display
             )
             
-            # Auto-refresh functionality
-            def auto_refresh_console_output():
-                """Auto-refresh console output when debugger is active."""
-                return self.get_debugger_console()
-            
-            def toggle_auto_refresh(enabled):
-                """Toggle auto-refresh functionality."""
-                if enabled:
-                    self.start_auto_refresh()
-                else:
-                    self.stop_auto_refresh()
-                return self.get_debugger_console()
-            
-            # Set up auto-refresh toggle
-            auto_refresh_toggle.change(
-                toggle_auto_refresh,
-                inputs=[auto_refresh_toggle],
-                outputs=console_display
-            )
-            
             # Add auto-refresh that only runs when debugger is active
             def conditional_auto_refresh():
                 """Auto-refresh only when debugger is attached and there are new events."""
-                if self.debugger.is_attached():
-                    current_count = len(self.console_events)
-                    if current_count != self._last_event_count:
-                        self._last_event_count = current_count
-                        return self.get_debugger_console()
+                if self.debugger.is_attached() and self._has_console_updates():
+                    return self.get_debugger_console()
                 return gr.update()  # No update if debugger not attached or no new events
             
             # Set up refresh button with conditional logic
@@ -473,9 +597,24 @@ class DebugAgentInterface:
                 outputs=console_display
             )
             
-            # Note: Auto-refresh is handled manually via the refresh button
-            # Users can click refresh to see new events, or use the auto-refresh toggle
-            # for immediate updates when toggled
+            # Auto-refresh functionality - Gradio's timer ticks over the existing
+            # connection, and idle ticks cost nothing since no update is sent
+            console_timer = gr.Timer(value=0.5, active=False)
+            console_timer.tick(
+                conditional_auto_refresh,
+                outputs=console_display
+            )
+            
+            def toggle_auto_refresh(enabled):
+                """Toggle auto-refresh functionality."""
+                return self.get_debugger_console(), gr.Timer(active=enabled)
+            
+            # Set up auto-refresh toggle
+            auto_refresh_toggle.change(
+                toggle_auto_refresh,
+                inputs=[auto_refresh_toggle],
+                outputs=[console_display, console_timer]
+            )
             
             clear_console_btn.click(
                 self.clear_debugger_console,
@@ -483,16 +622,9 @@ class DebugAgentInterface:
             )
             
             # Example button handlers
-            example_prompts = [
-                "Help me debug my C++ application. The executable is at C:\\path\\to\\app.exe",
-                "I have a crash dump file. Can you help me analyze it?",
-                "My application is crashing with an access violation. What should I do?",
-                "How do I set breakpoints to debug my application?"
-            ]
-            
-            for i, btn in enumerate(example_buttons):
+            for btn, prompt in zip(example_buttons, self._EXAMPLE_PROMPTS):
                 btn.click(
-                    lambda prompt=example_prompts[i]: ([], prompt, ""),
+                    partial(_use_example_prompt, prompt),
                     outputs=[chatbot, msg, tool_call_display]
                 )
         
@@ -519,18 +651,17 @@ class DebugAgentInterface:
 
     def _handle_tool_call(self, tool_call_info: dict):
         """Handle tool call notifications from the completion handler."""
-        # Log what goes into this function
-        print(f"Tool call info: {tool_call_info}")
-        print(f"Tool call type: {tool_call_info['type']}")
-        print(f"Tool name: {tool_call_info['tool_name']}")
-
         tool_call_type = tool_call_info["type"]
         tool_name = tool_call_info["tool_name"]
+        logger.debug("Tool call %s: %s", tool_call_type, tool_name)
+        tool_call_id = tool_call_info.get("tool_call_id", tool_name)
+        self._tool_call_html_dirty = True
         
         if tool_call_type == "tool_call_start":
             # Add tool call start message to chat history
-            args_str = json.dumps(tool_call_info["arguments"], indent=2)
+            args_str = _format_json_for_display(tool_call_info["arguments"])
             tool_message = f"🔧 **Executing tool:** `{tool_name}`\n\n**Arguments:**\n```json\n{args_str}\n```"
+            self._pending_tool_calls[tool_call_id] = len(self.chat_history)
             self.chat_history.append({
                 "role": "tool_call",
                 "content": tool_message,
@@ -542,38 +673,32 @@ class DebugAgentInterface:
             # Update the tool call message with results
             result = tool_call_info["result"]
             if result.success:
-                result_str = json.dumps(result.data, indent=2)
+                result_str = _format_json_for_display(result.data)
                 tool_message = f"✅ **Tool completed:** `{tool_name}`\n\n**Result:**\n```json\n{result_str}\n```"
             else:
                 tool_message = f"❌ **Tool failed:** `{tool_name}`\n\n**Error:** {result.error}"
             
-            # Find and update the corresponding tool call message
-            for i, msg in enumerate(self.chat_history):
-                if (msg.get("role") == "tool_call" and 
-                    msg.get("tool_name") == tool_name and 
-                    msg.get("status") == "started"):
-                    self.chat_history[i] = {
-                        "role": "tool_call",
-                        "content": tool_message,
-                        "tool_name": tool_name,
-                        "status": "completed" if result.success else "failed"
-                    }
-                    break
+            # Update the corresponding tool call message
+            index = self._pending_tool_calls.pop(tool_call_id, None)
+            if index is not None:
+                self.chat_history[index] = {
+                    "role": "tool_call",
+                    "content": tool_message,
+                    "tool_name": tool_name,
+                    "status": "completed" if result.success else "failed"
+                }
                     
         elif tool_call_type == "tool_call_error":
             # Update the tool call message with error
             error_msg = tool_call_info["error"]
             tool_message = f"💥 **Tool error:** `{tool_name}`\n\n**Error:** {error_msg}"
             
-            # Find and update the corresponding tool call message
-            for i, msg in enumerate(self.chat_history):
-                if (msg.get("role") == "tool_call" and 
-                    msg.get("tool_name") == tool_name and 
-                    msg.get("status") == "started"):
-                    self.chat_history[i] = {
-                        "role": "tool_call",
-                        "content": tool_message,
-                        "tool_name": tool_name,
-                        "status": "error"
-                    }
-                    break 
\ No newline at end of file
+            # Update the corresponding tool call message
+            index = self._pending_tool_calls.pop(tool_call_id, None)
+            if index is not None:
+                self.chat_history[index] = {
+                    "role": "tool_call",
+                    "content": tool_message,
+                    "tool_name": tool_name,
+                    "status": "error"
+                }
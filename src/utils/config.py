@@ -7,27 +7,50 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment settings, read once at import time
+_OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
+_OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+_OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
+_GRADIO_HOST: str = os.getenv("GRADIO_HOST", "127.0.0.1")
+_GRADIO_PORT: int = int(os.getenv("GRADIO_PORT", "7860"))
+_GRADIO_SHARE: bool = os.getenv("GRADIO_SHARE", "false").lower() == "true"
+_DEBUG_TIMEOUT: int = int(os.getenv("DEBUG_TIMEOUT", "30"))  # seconds
+_MAX_CRASH_ANALYSIS_DEPTH: int = int(os.getenv("MAX_CRASH_ANALYSIS_DEPTH", "10"))
+_WINDOWS_DEBUGGER_PATH: Optional[str] = os.getenv("WINDOWS_DEBUGGER_PATH")
+
 
 class Config:
     """Configuration settings for the debug agent."""
-    
+
+    __slots__ = (
+        "openai_api_key",
+        "openai_base_url",
+        "openai_model",
+        "gradio_host",
+        "gradio_port",
+        "gradio_share",
+        "debug_timeout",
+        "max_crash_analysis_depth",
+        "windows_debugger_path",
+    )
+
     def __init__(self):
-        self.openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
-        self.openai_base_url: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
-        self.openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
-        
+        self.openai_api_key: Optional[str] = _OPENAI_API_KEY
+        self.openai_base_url: str = _OPENAI_BASE_URL
+        self.openai_model: str = _OPENAI_MODEL
+
         # Gradio settings
-        self.gradio_host: str = os.getenv("GRADIO_HOST", "127.0.0.1")
-        self.gradio_port: int = int(os.getenv("GRADIO_PORT", "7860"))
-        self.gradio_share: bool = os.getenv("GRADIO_SHARE", "false").lower() == "true"
-        
+        self.gradio_host: str = _GRADIO_HOST
+        self.gradio_port: int = _GRADIO_PORT
+        self.gradio_share: bool = _GRADIO_SHARE
+
         # Debug settings
-        self.debug_timeout: int = int(os.getenv("DEBUG_TIMEOUT", "30"))  # seconds
-        self.max_crash_analysis_depth: int = int(os.getenv("MAX_CRASH_ANALYSIS_DEPTH", "10"))
-        
+        self.debug_timeout: int = _DEBUG_TIMEOUT
+        self.max_crash_analysis_depth: int = _MAX_CRASH_ANALYSIS_DEPTH
+
         # Platform specific settings
-        self.windows_debugger_path: Optional[str] = os.getenv("WINDOWS_DEBUGGER_PATH")
-        
+        self.windows_debugger_path: Optional[str] = _WINDOWS_DEBUGGER_PATH
+
     def validate(self) -> bool:
         """Validate that required configuration is present."""
         if not self.openai_api_key:
@@ -36,4 +59,4 @@ class Config:
 
 
 # Global config instance
-config = Config() 
\ No newline at end of file
+config = Config()
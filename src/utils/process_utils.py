@@ -2,59 +2,341 @@
 
 import os
 import sys
-import psutil
+import signal
 import subprocess
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Iterable, Optional, Any, NamedTuple, Sequence, Tuple
 
-# Handle imports for both package and direct execution
-try:
-    from src.utils.exceptions import ProcessError, LaunchError
-except ImportError:
-    from utils.exceptions import ProcessError, LaunchError
+# Relative, so it resolves whether this package is imported as src.utils or utils
+from .exceptions import ProcessError, LaunchError
 
+# psutil and asyncio are imported where they are used, so importing this
+# module stays cheap
+if TYPE_CHECKING:
+    import asyncio
+    import psutil
 
-@dataclass
-class ProcessInfo:
+if sys.platform == "win32":
+    import ctypes
+    
+    class _UnicodeString(ctypes.Structure):
+        """UNICODE_STRING from the Windows native API."""
+        _fields_ = [
+            ("Length", ctypes.c_uint16),
+            ("MaximumLength", ctypes.c_uint16),
+            ("Buffer", ctypes.c_void_p),
+        ]
+    
+    class _SystemProcessInformation(ctypes.Structure):
+        """Leading fields of SYSTEM_PROCESS_INFORMATION, up to the process ID."""
+        _fields_ = [
+            ("NextEntryOffset", ctypes.c_uint32),
+            ("NumberOfThreads", ctypes.c_uint32),
+            ("WorkingSetPrivateSize", ctypes.c_int64),
+            ("HardFaultCount", ctypes.c_uint32),
+            ("NumberOfThreadsHighWatermark", ctypes.c_uint32),
+            ("CycleTime", ctypes.c_uint64),
+            ("CreateTime", ctypes.c_int64),
+            ("UserTime", ctypes.c_int64),
+            ("KernelTime", ctypes.c_int64),
+            ("ImageName", _UnicodeString),
+            ("BasePriority", ctypes.c_int32),
+            ("UniqueProcessId", ctypes.c_void_p),
+        ]
+
+
+class ProcessInfo(NamedTuple):
     """Information about a running process."""
     pid: int
     name: str
     exe_path: Optional[str]
-    cmdline: List[str]
+    cmdline: Sequence[str]
     status: str
     cpu_percent: float
     memory_percent: float
 
 
-class ProcessManager:
-    """Cross-platform process management utilities."""
+# Shared fallbacks for unreadable names and command lines, so rows for
+# restricted processes don't each allocate their own empty list
+_UNKNOWN = "Unknown"
+_EMPTY: Tuple[str, ...] = ()
+
+# Recently used psutil.Process handles by PID. Reusing a handle skips
+# re-validating the PID and lets cpu_percent() measure against the previous call.
+_PROCESS_CACHE_SIZE = 1024
+_process_cache: "OrderedDict[int, psutil.Process]" = OrderedDict()
+_process_cache_lock = threading.Lock()
+
+# Seconds between the two samples cpu_percent() needs for a meaningful value
+_CPU_SAMPLE_INTERVAL = 0.1
+
+# Seconds a process listing is reused before the process table is read again
+_LISTING_TTL = 1.0
+
+# Most recent listing as (time.monotonic() when read, whether CPU was sampled, columns)
+_listing_cache: Optional[Tuple[float, bool, Dict[str, List[Any]]]] = None
+
+# Process counts above which per-process fields are read from a thread pool,
+# and its size; below it the pool costs more than the overlapped reads save
+_PARALLEL_READ_THRESHOLD = 256
+_READ_WORKERS = 8
+
+# NtQuerySystemInformation class and status used for the Windows process
+# snapshot, and how often to retry when the process table outgrows the buffer
+_SYSTEM_PROCESS_INFORMATION = 5
+_STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+_SNAPSHOT_ATTEMPTS = 4
+
+# fcntl command for resizing a pipe on Linux (fcntl.F_SETPIPE_SZ on Python 3.10+)
+_F_SETPIPE_SZ = 1031
+
+
+def _get_process(pid: int) -> "psutil.Process":
+    """Get a cached psutil.Process for a PID, raising NoSuchProcess if it is gone."""
+    import psutil
+    
+    proc = _cached_process(pid)
+    
+    # is_running() also compares creation times, so a recycled PID is not reused
+    if proc is None or not proc.is_running():
+        _forget_process(pid)
+        proc = psutil.Process(pid)
+        with _process_cache_lock:
+            _process_cache[pid] = proc
+            if len(_process_cache) > _PROCESS_CACHE_SIZE:
+                _process_cache.popitem(last=False)
+    return proc
+
+
+def _cached_process(pid: int) -> Optional["psutil.Process"]:
+    """Get the cached psutil.Process for a PID without validating it, if there is one."""
+    with _process_cache_lock:
+        proc = _process_cache.get(pid)
+        if proc is not None:
+            _process_cache.move_to_end(pid)
+    return proc
+
+
+def _pid_was_reused(pid: int) -> bool:
+    """Check whether a PID's cached handle shows it now belongs to another process."""
+    proc = _cached_process(pid)
+    # is_running() compares creation times, so it is False for a recycled PID
+    if proc is None or proc.is_running():
+        return False
+    _forget_process(pid)
+    return True
+
+
+def _forget_process(pid: int):
+    """Drop a PID from the process handle cache."""
+    with _process_cache_lock:
+        _process_cache.pop(pid, None)
+
+
+def _read_fields(proc: "psutil.Process", attrs: List[str]) -> Optional[Dict[str, Any]]:
+    """Read several process fields in one batch, or None if the process is gone."""
+    import psutil
     
-    @staticmethod
-    def list_processes() -> List[ProcessInfo]:
-        """List all running processes."""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline', 'status']):
+    try:
+        # as_dict() reads all fields under one oneshot(); unreadable ones are None
+        return proc.as_dict(attrs)
+    except psutil.NoSuchProcess:
+        return None
+
+
+def _build_process_info(proc: "psutil.Process", name: Optional[str]) -> ProcessInfo:
+    """Collect full process information for a process whose name is already known."""
+    # oneshot() batches the underlying OS queries for the calls below
+    with proc.oneshot():
+        # as_dict() leaves fields we may not read as None, like process_iter() does
+        details = proc.as_dict(['exe', 'cmdline', 'status'])
+        return ProcessInfo(
+            pid=proc.pid,
+            name=name or _UNKNOWN,
+            exe_path=details['exe'],
+            cmdline=details['cmdline'] or _EMPTY,
+            status=details['status'],
+            cpu_percent=proc.cpu_percent(),
+            memory_percent=proc.memory_percent()
+        )
+
+
+def _windows_process_names() -> Optional[List[Tuple[int, Optional[str]]]]:
+    """List (pid, name) for all processes with one NtQuerySystemInformation call.
+    
+    Returns None if the snapshot cannot be taken, so callers can fall back to psutil.
+    """
+    try:
+        query = ctypes.WinDLL("ntdll").NtQuerySystemInformation
+    except (OSError, AttributeError):
+        return None
+    query.restype = ctypes.c_uint32
+    query.argtypes = [
+        ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32)
+    ]
+    
+    size = 1 << 18
+    needed = ctypes.c_uint32()
+    for _ in range(_SNAPSHOT_ATTEMPTS):
+        buf = ctypes.create_string_buffer(size)
+        status = query(_SYSTEM_PROCESS_INFORMATION, buf, size, ctypes.byref(needed))
+        if status != _STATUS_INFO_LENGTH_MISMATCH:
+            break
+        # Leave headroom for processes started before the next attempt
+        size = max(needed.value, size) * 2
+    if status != 0:
+        return None
+    
+    processes = []
+    offset = 0
+    while True:
+        entry = _SystemProcessInformation.from_buffer(buf, offset)
+        image = entry.ImageName
+        # ImageName is not NUL-terminated, and is empty for the idle process
+        name = ctypes.wstring_at(image.Buffer, image.Length // 2) if image.Buffer else None
+        processes.append((entry.UniqueProcessId or 0, name))
+        if not entry.NextEntryOffset:
+            break
+        offset += entry.NextEntryOffset
+    return processes
+
+
+def _windows_creationflags(show_console: bool) -> int:
+    """Get the process creation flags for launching a debuggable process on Windows."""
+    if show_console:
+        # CREATE_NEW_CONSOLE = 0x00000010
+        return 0x00000010
+    # CREATE_NO_WINDOW | CREATE_NEW_PROCESS_GROUP avoids starting a console host
+    return 0x08000000 | 0x00000200
+
+
+def _launch_error(executable: str, working_dir: Optional[str], error: Exception) -> LaunchError:
+    """Wrap an error raised while starting a process in a LaunchError."""
+    # A missing working directory also raises FileNotFoundError
+    if isinstance(error, FileNotFoundError) and not (
+        working_dir is not None and error.filename == working_dir
+    ):
+        return LaunchError(f"Executable not found: {executable}")
+    return LaunchError(f"Failed to launch process {executable}: {error}")
+
+
+def _resize_pipes(process: subprocess.Popen, size: int):
+    """Grow a process's output pipes on Linux, ignoring failures."""
+    import fcntl
+    
+    for pipe in (process.stdout, process.stderr):
+        try:
+            fcntl.fcntl(pipe, _F_SETPIPE_SZ, size)
+        except OSError:
+            # Above /proc/sys/fs/pipe-max-size; keep the default size
+            continue
+
+
+def _read_listing(sample_cpu: bool) -> Dict[str, List[Any]]:
+    """Read all running processes into parallel lists keyed by ProcessInfo field."""
+    import psutil
+    
+    procs = list(psutil.process_iter())
+    attrs = ['pid', 'name', 'exe', 'cmdline', 'status', 'memory_percent']
+    
+    # The first cpu_percent() call always returns 0.0, so prime every
+    # handle and sample again after a short interval
+    if sample_cpu:
+        attrs.append('cpu_percent')
+        for proc in procs:
             try:
-                proc_info = ProcessInfo(
-                    pid=proc.info['pid'],
-                    name=proc.info['name'] or "Unknown",
-                    exe_path=proc.info['exe'],
-                    cmdline=proc.info['cmdline'] or [],
-                    status=proc.info['status'],
-                    cpu_percent=proc.cpu_percent(),
-                    memory_percent=proc.memory_percent()
-                )
-                processes.append(proc_info)
+                proc.cpu_percent()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # Process disappeared or access denied, skip it
                 continue
-        return processes
+        time.sleep(_CPU_SAMPLE_INTERVAL)
     
-    @staticmethod
-    def get_process_by_pid(pid: int) -> Optional[ProcessInfo]:
-        """Get process information by PID."""
-        try:
-            proc = psutil.Process(pid)
+    # psutil releases the GIL while reading process stats, so large
+    # process tables overlap the reads; map() keeps the original order
+    if len(procs) > _PARALLEL_READ_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            infos = list(executor.map(lambda proc: _read_fields(proc, attrs), procs))
+    else:
+        infos = [_read_fields(proc, attrs) for proc in procs]
+    
+    # Column lists are bound to locals so the loop avoids a dict lookup per field
+    columns: Dict[str, List[Any]] = {field: [] for field in ProcessInfo._fields}
+    pids = columns['pid']
+    names = columns['name']
+    exe_paths = columns['exe_path']
+    cmdlines = columns['cmdline']
+    statuses = columns['status']
+    cpu_percents = columns['cpu_percent']
+    memory_percents = columns['memory_percent']
+    for info in infos:
+        if info is None:
+            # Process disappeared, skip it
+            continue
+        memory_percent = info['memory_percent']
+        if memory_percent is None:
+            # Access denied, skip it
+            continue
+        
+        pids.append(info['pid'])
+        names.append(info['name'] or _UNKNOWN)
+        exe_paths.append(info['exe'])
+        # Tuples, since cached rows are shared between callers
+        cmdline = info['cmdline']
+        cmdlines.append(tuple(cmdline) if cmdline else _EMPTY)
+        statuses.append(info['status'])
+        cpu_percents.append(info.get('cpu_percent') or 0.0)
+        memory_percents.append(memory_percent)
+    return columns
+
+
+def _cached_listing(max_age: float, sample_cpu: bool) -> Optional[Dict[str, List[Any]]]:
+    """Get the cached listing if it is recent enough and sampled CPU when required."""
+    cached = _listing_cache
+    if cached is None:
+        return None
+    timestamp, sampled, columns = cached
+    if time.monotonic() - timestamp >= max_age or (sample_cpu and not sampled):
+        return None
+    return columns
+
+
+def _get_listing(max_age: float, sample_cpu: bool) -> Dict[str, List[Any]]:
+    """Get a process listing, reading the process table only when the cache is stale."""
+    global _listing_cache
+    
+    columns = _cached_listing(max_age, sample_cpu)
+    if columns is None:
+        columns = _read_listing(sample_cpu)
+        # A full read replaces every entry, so recycled PIDs never linger
+        _listing_cache = (time.monotonic(), sample_cpu, columns)
+    return columns
+
+
+def list_processes(sample_cpu: bool = False, max_age: float = _LISTING_TTL) -> List[ProcessInfo]:
+    """List all running processes, reusing a listing up to max_age seconds old."""
+    columns = _get_listing(max_age, sample_cpu)
+    return [ProcessInfo(*row) for row in zip(*columns.values())]
+
+
+def list_processes_columnar(
+    sample_cpu: bool = False,
+    max_age: float = _LISTING_TTL
+) -> Dict[str, List[Any]]:
+    """List all running processes as parallel lists keyed by ProcessInfo field."""
+    columns = _get_listing(max_age, sample_cpu)
+    # Copy the column lists; their items, including cmdline tuples, are immutable
+    return {field: list(values) for field, values in columns.items()}
+
+
+def get_process_by_pid(pid: int) -> Optional[ProcessInfo]:
+    """Get process information by PID."""
+    import psutil
+    
+    try:
+        proc = _get_process(pid)
+        with proc.oneshot():
             return ProcessInfo(
                 pid=proc.pid,
                 name=proc.name(),
@@ -64,77 +346,211 @@ class ProcessManager:
                 cpu_percent=proc.cpu_percent(),
                 memory_percent=proc.memory_percent()
             )
+    except psutil.NoSuchProcess:
+        _forget_process(pid)
+        return None
+    except psutil.AccessDenied:
+        return None
+
+
+def find_processes_by_name(name: str, max_age: float = _LISTING_TTL) -> List[ProcessInfo]:
+    """Find processes by name (partial match), reusing a listing up to max_age seconds old."""
+    import psutil
+    
+    needle = name.casefold()
+    
+    # A recent listing already has every name and field, so no process is opened
+    columns = _cached_listing(max_age, False)
+    if columns is not None:
+        return [
+            ProcessInfo(*row) for row in zip(*columns.values())
+            if needle in row[1].casefold()
+        ]
+    
+    # On Windows one native snapshot gives every name without opening
+    # each process; psutil's prefetched names are used elsewhere
+    candidates = _windows_process_names() if sys.platform == "win32" else None
+    if candidates is None:
+        candidates = [
+            (proc.info['pid'], proc.info['name'])
+            for proc in psutil.process_iter(['pid', 'name'])
+        ]
+    
+    processes = []
+    # Filter on the name first; full details only for matches
+    for pid, proc_name in candidates:
+        if needle not in (proc_name or "").casefold():
+            continue
+        try:
+            processes.append(_build_process_info(_get_process(pid), proc_name))
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return None
-    
-    @staticmethod
-    def find_processes_by_name(name: str) -> List[ProcessInfo]:
-        """Find processes by name (partial match)."""
-        processes = []
-        for proc_info in ProcessManager.list_processes():
-            if name.lower() in proc_info.name.lower():
-                processes.append(proc_info)
-        return processes
-    
-    @staticmethod
-    def launch_process(
-        executable: str, 
-        args: Optional[List[str]] = None,
-        working_dir: Optional[str] = None,
-        env: Optional[Dict[str, str]] = None
-    ) -> subprocess.Popen:
-        """Launch a new process."""
-        if not os.path.exists(executable):
-            raise LaunchError(f"Executable not found: {executable}")
+            continue
+    return processes
+
+
+def launch_process(
+    executable: str, 
+    args: Optional[List[str]] = None,
+    working_dir: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    capture_output: bool = False,
+    pipe_bufsize: int = 1 << 20,
+    show_console: bool = False
+) -> subprocess.Popen:
+    """Launch a new process, piping its output only if capture_output is set."""
+    cmd = [executable]
+    if args:
+        cmd.extend(args)
+    
+    # Uncollected pipes fill up and stall the child, so discard output
+    # unless the caller reads it, and then use larger pipes
+    popen_kwargs: Dict[str, Any] = {}
+    if capture_output:
+        popen_kwargs["stdout"] = subprocess.PIPE
+        popen_kwargs["stderr"] = subprocess.PIPE
+        if sys.version_info >= (3, 10):
+            popen_kwargs["pipesize"] = pipe_bufsize
+    else:
+        popen_kwargs["stdout"] = subprocess.DEVNULL
+        popen_kwargs["stderr"] = subprocess.DEVNULL
+    
+    if sys.platform == "win32":
+        popen_kwargs["creationflags"] = _windows_creationflags(show_console)
+    
+    try:
+        process = subprocess.Popen(
+            cmd,
+            cwd=working_dir,
+            env=env,
+            **popen_kwargs
+        )
         
-        cmd = [executable]
-        if args:
-            cmd.extend(args)
+        if capture_output and sys.version_info < (3, 10) and sys.platform.startswith("linux"):
+            _resize_pipes(process, pipe_bufsize)
         
-        try:
-            # On Windows, we want to create the process in a way that allows debugging
-            if sys.platform == "win32":
-                # CREATE_NEW_CONSOLE = 0x00000010
-                creationflags = 0x00000010
-                process = subprocess.Popen(
-                    cmd,
-                    cwd=working_dir,
-                    env=env,
-                    creationflags=creationflags,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-            else:
-                process = subprocess.Popen(
-                    cmd,
-                    cwd=working_dir,
-                    env=env,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-            
-            return process
-            
-        except Exception as e:
-            raise LaunchError(f"Failed to launch process {executable}: {e}")
-    
-    @staticmethod
-    def is_process_running(pid: int) -> bool:
-        """Check if a process is still running."""
-        try:
-            return psutil.pid_exists(pid)
-        except Exception:
-            return False
+        return process
+        
+    except Exception as e:
+        raise _launch_error(executable, working_dir, e)
+
+
+async def launch_process_async(
+    executable: str,
+    args: Optional[List[str]] = None,
+    working_dir: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    stream_limit: int = 1 << 20,
+    show_console: bool = False
+) -> "asyncio.subprocess.Process":
+    """Launch a new process whose output is read through the running event loop.
     
-    @staticmethod
-    def kill_process(pid: int, force: bool = False) -> bool:
-        """Kill a process by PID."""
-        try:
-            proc = psutil.Process(pid)
-            if force:
-                proc.kill()
-            else:
-                proc.terminate()
+    stream_limit is the buffer limit of the stdout/stderr StreamReaders, which
+    caps the length of a line readline() can return; it does not size the pipes.
+    """
+    import asyncio
+    
+    # The default Windows loop (Proactor) reads the pipes with overlapped
+    # I/O instead of a blocking thread per pipe; POSIX loops use selectors
+    kwargs: Dict[str, Any] = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = _windows_creationflags(show_console)
+    
+    try:
+        return await asyncio.create_subprocess_exec(
+            executable,
+            *(args or ()),
+            cwd=working_dir,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=stream_limit,
+            **kwargs
+        )
+    except Exception as e:
+        raise _launch_error(executable, working_dir, e)
+
+
+def is_process_running(pid: int) -> bool:
+    """Check if a process is still running."""
+    try:
+        # Signal 0 only checks the PID; pid <= 0 would address process groups
+        if os.name == "posix" and pid > 0:
+            os.kill(pid, 0)
             return True
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return False 
\ No newline at end of file
+        
+        import psutil
+        return psutil.pid_exists(pid)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    except (OverflowError, TypeError):
+        # Out-of-range or non-integer PIDs (e.g. from tool arguments) can't be running
+        return False
+
+
+def kill_process(pid: int, force: bool = False) -> bool:
+    """Kill a process by PID, refusing if a cached handle shows the PID was reused."""
+    import psutil
+    
+    # Don't signal whatever process has taken over a PID we looked up before
+    if _pid_was_reused(pid):
+        return False
+    
+    try:
+        proc = _get_process(pid)
+        if force:
+            proc.kill()
+        else:
+            proc.terminate()
+        return True
+    except psutil.NoSuchProcess:
+        _forget_process(pid)
+        return False
+    except psutil.AccessDenied:
+        return False 
+
+
+def kill_processes(pids: Iterable[int], force: bool = False) -> List[int]:
+    """Kill several processes, returning the PIDs that were signalled.
+    
+    As in kill_process(), a PID whose cached handle shows it was reused is
+    skipped. PIDs without a cached handle cannot be checked and are signalled
+    whatever process holds them; on POSIX this is done with os.kill() directly.
+    """
+    killed = []
+    if os.name != "posix":
+        for pid in pids:
+            if kill_process(pid, force):
+                killed.append(pid)
+        return killed
+    
+    # Signal directly rather than building a psutil.Process per PID
+    sig = signal.SIGKILL if force else signal.SIGTERM
+    for pid in pids:
+        if pid <= 0:
+            # 0 and negative PIDs address whole process groups
+            continue
+        if _pid_was_reused(pid):
+            continue
+        try:
+            os.kill(pid, sig)
+        except (ProcessLookupError, PermissionError):
+            continue
+        killed.append(pid)
+    return killed
+
+
+class ProcessManager:
+    """Cross-platform process management utilities, kept for existing callers."""
+    
+    list_processes = staticmethod(list_processes)
+    list_processes_columnar = staticmethod(list_processes_columnar)
+    get_process_by_pid = staticmethod(get_process_by_pid)
+    find_processes_by_name = staticmethod(find_processes_by_name)
+    launch_process = staticmethod(launch_process)
+    is_process_running = staticmethod(is_process_running)
+    launch_process_async = staticmethod(launch_process_async)
+    kill_process = staticmethod(kill_process)
+    kill_processes = staticmethod(kill_processes)
@@ -28,12 +28,18 @@ def test_tool_call_functionality():
     interface._handle_tool_call(test_tool_call)
     
     # Check if tool call was added to history
-    tool_calls = [msg for msg in interface.chat_history if msg.get("role") == "tool_call"]
-    print(f"Found {len(tool_calls)} tool call messages in history")
+    tool_call_count = 0
+    first_tool_call = None
+    for msg in interface.chat_history:
+        if msg.get("role") == "tool_call":
+            tool_call_count += 1
+            if first_tool_call is None:
+                first_tool_call = msg
+    print(f"Found {tool_call_count} tool call messages in history")
     
-    if tool_calls:
+    if first_tool_call is not None:
         print("Tool call message content:")
-        print(tool_calls[0]["content"])
+        print(first_tool_call["content"])
         
         # Test formatting
         html_output = interface._format_tool_calls_for_display()